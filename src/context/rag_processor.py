@@ -8,7 +8,7 @@ from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
-from openai_api.openai import common_get_embedding, ask_openai_for_json
+from openai_api.openai import common_get_embedding, common_get_embeddings, ask_openai_for_json
 
 
 class RAGProcessor:
@@ -52,8 +52,8 @@ class RAGProcessor:
             print(f"Table {self.table_name_function} is missing, creating it")
             
         if file_table_exists:
-            unique_files = list(set(func['relative_file_path'] for func in project_audit.functions_to_check))
-            files_count_match = self._check_data_count(self.table_name_file, len(unique_files))
+            unique_file_count = len({func['relative_file_path'] for func in project_audit.functions_to_check})
+            files_count_match = self._check_data_count(self.table_name_file, unique_file_count)
         else:
             print(f"Table {self.table_name_file} is missing, creating it")
             
@@ -259,10 +259,10 @@ Response format: A clear, concise description in English (2-3 sentences).
         # 生成自然语言描述
         natural_description = self._translate_to_natural_language(func['content'], func['name'])
         
-        # 生成3种embedding
-        content_embedding = common_get_embedding(func['content'])
-        name_embedding = common_get_embedding(full_name)
-        natural_embedding = common_get_embedding(natural_description)
+        # 生成3种embedding（合并为一次请求）
+        content_embedding, name_embedding, natural_embedding = common_get_embeddings(
+            [func['content'], full_name, natural_description]
+        )
         
         return {
             # 基本标识
@@ -297,9 +297,10 @@ Response format: A clear, concise description in English (2-3 sentences).
         # 生成文件的自然语言描述
         natural_description = self._generate_file_description(file_path, file_content, functions_list)
         
-        # 生成2种embedding
-        content_embedding = common_get_embedding(file_content[:4000])  # 限制文件内容长度
-        natural_embedding = common_get_embedding(natural_description)
+        # 生成2种embedding（合并为一次请求）
+        content_embedding, natural_embedding = common_get_embeddings(
+            [file_content[:4000], natural_description]  # 限制文件内容长度
+        )
         
         # 获取文件扩展名
         file_extension = os.path.splitext(file_path)[1] if '.' in file_path else ''
@@ -334,9 +335,10 @@ Response format: A clear, concise description in English (2-3 sentences).
             chunk.chunk_order
         )
         
-        # 生成2种embedding
-        content_embedding = common_get_embedding(chunk.chunk_text)
-        natural_embedding = common_get_embedding(natural_description)
+        # 生成2种embedding（合并为一次请求）
+        content_embedding, natural_embedding = common_get_embeddings(
+            [chunk.chunk_text, natural_description]
+        )
         
         # 获取文件扩展名
         file_extension = os.path.splitext(chunk.original_file)[1] if '.' in chunk.original_file else ''
@@ -6,9 +6,17 @@
 从library/dataset_utils.py迁移而来，专门处理项目数据集
 """
 
+import asyncio
 import os
 import json
 
+# orjson可选：解析大型datasets.json更快，未安装时回退到标准库json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 def load_dataset(dataset_path, external_project_id=None, external_project_path=None):
     """
     加载数据集配置
@@ -21,18 +29,19 @@ def load_dataset(dataset_path, external_project_id=None, external_project_path=N
     Returns:
         dict: 项目配置字典
     """
+    projects = {}
+
     # Load projects from datasets.json
     if not external_project_id and not external_project_path:
         ds_json = os.path.join(dataset_path, "datasets.json")
-        dj = json.load(open(ds_json, 'r', encoding='utf-8'))
-        projects = {}
+        with open(ds_json, 'rb') as f:
+            dj = _json_loads(f.read())
         for k, v in dj.items():
             v['base_path'] = dataset_path
             projects[k] = v
 
     # Handle external project input
     if external_project_id and external_project_path:
-        projects = {}
         # Construct project data structure for the external project
         external_project = {
             'path': external_project_path,
@@ -45,6 +54,15 @@ def load_dataset(dataset_path, external_project_id=None, external_project_path=N
     return projects
 
 
+async def load_dataset_async(dataset_path, external_project_id=None, external_project_path=None):
+    """
+    load_dataset的异步版本，在线程池中读取和解析datasets.json，避免阻塞事件循环
+
+    参数与返回值同load_dataset
+    """
+    return await asyncio.to_thread(load_dataset, dataset_path, external_project_id, external_project_path)
+
+
 class Project(object):
     """项目配置类"""
     
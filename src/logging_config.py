@@ -6,12 +6,140 @@ Logging configuration module.
 Provides unified logging configuration and management helpers.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from datetime import datetime
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
 
+# Separator lines for the banner and section helpers.
+_BAR_80 = "=" * 80
+_BAR_60 = "=" * 60
+_DASH_60 = "-" * 60
+
+# Multi-line banners are emitted as one record each.
+_STARTUP_BANNER = (
+    _BAR_80 + "\n"
+    "🚀 Finite Monkey Engine logging initialized\n"
+    "📁 Log file: %s\n"
+    "📊 Log level: %s\n"
+    "🕐 Start time: %s\n"
+    + _BAR_80
+)
+_SECTION_START = _BAR_60 + "\n🔥 Starting: %s\n" + _BAR_60
+_SECTION_START_DETAILS = _BAR_60 + "\n🔥 Starting: %s\n📝 Details: %s\n" + _BAR_60
+_SECTION_END = _DASH_60 + "\n✅ Completed: %s\n" + _DASH_60
+_SECTION_END_DURATION = _DASH_60 + "\n✅ Completed: %s\n⏱️  Duration: %.2fs\n" + _DASH_60
+
+# Log file records are batched in memory and written through a large stream buffer.
+_FILE_BATCH_CAPACITY = 1024
+_FILE_BUFFER_SIZE = 64 * 1024
+# Buffered records never wait longer than this (seconds) before reaching the file.
+_FILE_FLUSH_INTERVAL = 2.0
+
+class _SharedFormatter(logging.Formatter):
+    """Formatter shared by the file and console handlers.
+
+    Both handlers format the same record with the same format, so the rendered
+    line is cached on the record and the second handler reuses it.
+    """
+
+    def format(self, record):
+        formatted = getattr(record, '_shared_formatted', None)
+        if formatted is None:
+            formatted = super().format(record)
+            record._shared_formatted = formatted
+        return formatted
+
+_FORMATTER = _SharedFormatter(
+    '%(asctime)s | %(levelname)-8s | %(name)-20s | %(funcName)-15s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Background listener that owns the real file/console handlers.
+_queue_listener = None
+
+def _stop_queue_listener():
+    """Stop the background listener and close its handlers, flushing any queued and batched records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler for a same-process listener.
+
+    The stock prepare() formats the message and then copies the whole record so it
+    can be pickled; the listener here shares our address space, so the message is
+    still rendered on the calling thread (args may be mutated after the call) but
+    the record itself is queued without the copy.
+    """
+
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue has been idle for a while.
+
+    Keeps sparse logging from sitting in the batch buffer until the next record arrives.
+    """
+
+    def dequeue(self, block):
+        if not block:
+            return self.queue.get(block)
+        while True:
+            try:
+                return self.queue.get(timeout=_FILE_FLUSH_INTERVAL)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a large buffer and only flushes on request."""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=_FILE_BUFFER_SIZE)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+class _BatchingMemoryHandler(MemoryHandler):
+    """MemoryHandler that also flushes its target once each batch has been written.
+
+    A batch is also written once its oldest record is older than _FILE_FLUSH_INTERVAL,
+    so a steady trickle of records cannot hold the file back until the buffer fills.
+    """
+
+    def shouldFlush(self, record):
+        return (super().shouldFlush(record)
+                or record.created - self.buffer[0].created >= _FILE_FLUSH_INTERVAL)
+
+    def flush(self):
+        super().flush()
+        if self.target is not None:
+            self.target.flush()
+
+    def close(self):
+        # MemoryHandler.close() flushes and then drops its target without closing it
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
 def setup_logging(log_file_path=None, level=logging.INFO):
     """
     Configure global logging.
@@ -22,42 +150,43 @@ def setup_logging(log_file_path=None, level=logging.INFO):
     """
     
     if log_file_path is None:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file_path = log_dir / f"finite_monkey_engine_{timestamp}.log"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        log_file_path = Path("logs") / f"finite_monkey_engine_{timestamp}.log"
     
-    log_dir = Path(log_file_path).parent
-    log_dir.mkdir(parents=True, exist_ok=True)
+    Path(log_file_path).parent.mkdir(parents=True, exist_ok=True)
     
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    global _queue_listener
     
-    formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(name)-20s | %(funcName)-15s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers:
+        handler.close()
+    root_logger.handlers.clear()
+    _stop_queue_listener()
     
-    file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
+    file_handler = _BufferedFileHandler(log_file_path, encoding='utf-8', delay=True)
     file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
+    # Records reach the file in batches: when the buffer fills, on ERROR, after
+    # _FILE_FLUSH_INTERVAL seconds, or at shutdown
+    batched_file_handler = _BatchingMemoryHandler(
+        _FILE_BATCH_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+    )
+    batched_file_handler.setLevel(level)
     
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
+    
+    # Callers only enqueue records; file and console I/O happen on the listener thread
+    log_queue = queue.Queue(-1)
+    _queue_listener = _FlushingQueueListener(log_queue, batched_file_handler, console_handler, respect_handler_level=True)
+    _queue_listener.start()
     
     root_logger.setLevel(level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(_InProcessQueueHandler(log_queue))
     
     logger = logging.getLogger(__name__)
-    logger.info("="*80)
-    logger.info("🚀 Finite Monkey Engine logging initialized")
-    logger.info(f"📁 Log file: {log_file_path}")
-    logger.info(f"📊 Log level: {logging.getLevelName(level)}")
-    logger.info(f"🕐 Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info("="*80)
+    logger.info(_STARTUP_BANNER, log_file_path, logging.getLevelName(level), time.strftime('%Y-%m-%d %H:%M:%S'))
     
     return str(log_file_path)
 
@@ -73,46 +202,66 @@ def get_logger(name):
     """
     return logging.getLogger(name)
 
-def log_section_start(logger, section_name, description=""):
+def _log_details(logger, prefix, details, args):
+    """Emit a details line; with args, details is a %-format string expanded lazily."""
+    # stacklevel=2 keeps the calling helper (log_step, log_success, ...) as funcName
+    if args:
+        logger.info(prefix + details, *args, stacklevel=2)
+    else:
+        logger.info(prefix + "%s", details, stacklevel=2)
+
+def log_section_start(logger, section_name, description="", *args):
     """Record the start of a logical section."""
-    logger.info("="*60)
-    logger.info(f"🔥 Starting: {section_name}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if description:
-        logger.info(f"📝 Details: {description}")
-    logger.info("="*60)
+        logger.info(_SECTION_START_DETAILS, section_name, description % args if args else description)
+    else:
+        logger.info(_SECTION_START, section_name)
 
 def log_section_end(logger, section_name, duration=None):
     """Record the end of a logical section."""
-    logger.info("-"*60)
-    logger.info(f"✅ Completed: {section_name}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if duration:
-        logger.info(f"⏱️  Duration: {duration:.2f}s")
-    logger.info("-"*60)
+        logger.info(_SECTION_END_DURATION, section_name, duration)
+    else:
+        logger.info(_SECTION_END, section_name)
 
-def log_step(logger, step_name, details=""):
+def log_step(logger, step_name, details="", *args):
     """Record an execution step."""
-    logger.info(f"🔹 {step_name}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("🔹 %s", step_name)
     if details:
-        logger.info(f"   Details: {details}")
+        _log_details(logger, "   Details: ", details, args)
 
 def log_error(logger, error_msg, exception=None):
     """Record error information."""
-    logger.error(f"❌ Error: {error_msg}")
+    logger.error("❌ Error: %s", error_msg)
     if exception:
-        logger.error(f"   Exception: {str(exception)}", exc_info=True)
+        logger.error("   Exception: %s", exception, exc_info=True)
 
 def log_warning(logger, warning_msg):
     """Record warning information."""
-    logger.warning(f"⚠️  Warning: {warning_msg}")
+    logger.warning("⚠️  Warning: %s", warning_msg)
 
-def log_success(logger, success_msg, details=""):
+def log_success(logger, success_msg, details="", *args):
     """Record success information."""
-    logger.info(f"✅ Success: {success_msg}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("✅ Success: %s", success_msg)
     if details:
-        logger.info(f"   Details: {details}")
+        _log_details(logger, "   Details: ", details, args)
 
-def log_data_info(logger, data_name, count, details=""):
+def log_data_info(logger, data_name, count, details="", *args):
     """Record data-related information."""
-    logger.info(f"📊 {data_name}: {count}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("📊 %s: %s", data_name, count)
     if details:
-        logger.info(f"   Details: {details}")
+        _log_details(logger, "   Details: ", details, args)
+
+def log_metrics(logger, title, **metrics):
+    """Record several related data points as a single log record."""
+    logger.info("📊 %s | %s", title, metrics)
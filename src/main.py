@@ -1,45 +1,57 @@
-import argparse
-import ast
+import logging
 import os
 import sys
 import time
-from ai_engine import *
-from tree_sitter_parsing import TreeSitterProjectAudit as ProjectAudit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dataset_manager import load_dataset, Project
-from planning.planning import Planning
 from sqlalchemy import create_engine
-from dao import CacheManager, ProjectTaskMgr
-import pandas as pd
-from openpyxl import Workbook, load_workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
+from dao import ProjectTaskMgr
 from res_processor.res_processor import ResProcessor
 
 import dotenv
 dotenv.load_dotenv()
 
 # Configure logging system
-from logging_config import setup_logging, get_logger, log_section_start, log_section_end, log_step, log_error, log_warning, log_success, log_data_info
+from logging_config import setup_logging, get_logger, log_section_start, log_section_end, log_step, log_error, log_warning, log_success, log_data_info, log_metrics
 
 
+@lru_cache(maxsize=8)
+def get_project_taskmgr(project_id, db_engine):
+    """Return the task manager for a project, shared by the scan and verification phases."""
+    return ProjectTaskMgr(project_id, db_engine)
+
 
 def scan_project(project, db_engine):
+    # parsing/planning/AI engine are only needed for scans; import lazily so Excel-only runs stay light
+    from ai_engine import AiEngine
+    from planning.planning import Planning
+    from tree_sitter_parsing import TreeSitterProjectAudit as ProjectAudit
+    
     logger = get_logger("scan_project")
     scan_start_time = time.time()
     
-    log_section_start(logger, "Project scan", f"Project ID: {project.id}, path: {project.path}")
+    log_section_start(logger, "Project scan", "Project ID: %s, path: %s", project.id, project.path)
+    
+    # task manager DB setup only needs the project id, so run it in the background
+    # while parsing and RAG indexing proceed; shutdown(wait=False) still completes the task
+    taskmgr_executor = ThreadPoolExecutor(max_workers=1)
+    taskmgr_future = taskmgr_executor.submit(get_project_taskmgr, project.id, db_engine)
+    taskmgr_executor.shutdown(wait=False)
     
     # 1. parsing projects  
-    log_step(logger, "Parse project with Tree-sitter", f"Project path: {project.path}")
+    log_step(logger, "Parse project with Tree-sitter", "Project path: %s", project.path)
     parsing_start = time.time()
     
     project_audit = ProjectAudit(project.id, project.path, db_engine)
     project_audit.parse()
     
     parsing_duration = time.time() - parsing_start
-    log_success(logger, "Project parsing completed", f"Duration: {parsing_duration:.2f}s")
-    log_data_info(logger, "Parsed functions", len(project_audit.functions_to_check))
-    log_data_info(logger, "Call trees", len(project_audit.call_trees))
-    log_data_info(logger, "Call graphs", len(project_audit.call_graphs))
+    log_success(logger, "Project parsing completed", "Duration: %.2fs", parsing_duration)
+    log_metrics(logger, "Parsing results",
+                functions=len(project_audit.functions_to_check),
+                call_trees=len(project_audit.call_trees),
+                call_graphs=len(project_audit.call_graphs))
     
     # 1.5 initialize RAG processor (optional)
     log_step(logger, "Initialize RAG processor")
@@ -55,21 +67,21 @@ def scan_project(project, db_engine):
         )
         
         rag_duration = time.time() - rag_start
-        log_success(logger, "RAG processor initialized", f"Duration: {rag_duration:.2f}s")
-        log_data_info(logger, "Functions from Tree-sitter used for RAG", len(project_audit.functions_to_check))
-        log_data_info(logger, "Document chunks used for RAG", len(project_audit.chunks))
-        log_data_info(logger, "Call trees used for relational RAG", len(project_audit.call_trees))
-        log_data_info(logger, "Integrated call graphs", len(project_audit.call_graphs))
-        
-        # Display call graph statistics if available
-        if project_audit.call_graphs:
+        log_success(logger, "RAG processor initialized", "Duration: %.2fs", rag_duration)
+        log_metrics(logger, "RAG inputs",
+                    functions=len(project_audit.functions_to_check),
+                    chunks=len(project_audit.chunks),
+                    call_trees=len(project_audit.call_trees),
+                    call_graphs=len(project_audit.call_graphs))
+        
+        # Display call graph statistics if available (a full pass over the edges, so only when INFO is on)
+        if project_audit.call_graphs and logger.isEnabledFor(logging.INFO):
             call_graph_stats = project_audit.get_call_graph_statistics()
             log_data_info(logger, "Call graph statistics", call_graph_stats)
         
     except ImportError as e:
         log_warning(logger, "RAG processor unavailable, using simplified functionality")
-        print(e)
-        logger.debug(f"ImportError details: {e}")
+        logger.debug("ImportError details: %s", e, exc_info=True)
     except Exception as e:
         log_error(logger, "Failed to initialize RAG processor", e)
         rag_processor = None
@@ -78,7 +90,7 @@ def scan_project(project, db_engine):
     
     # 2. planning & scanning - directly using project_audit
     log_step(logger, "Create task manager")
-    project_taskmgr = ProjectTaskMgr(project.id, db_engine) 
+    project_taskmgr = taskmgr_future.result()
     log_success(logger, "Task manager created")
     
     # create planning processor with project_audit
@@ -96,7 +108,7 @@ def scan_project(project, db_engine):
     log_step(logger, "Create AI engine")
     lancedb_table = rag_processor.db if rag_processor else None
     lancedb_table_name = rag_processor.table_name if rag_processor else f"lancedb_{project.id}"
-    logger.info(f"LanceDB table name: {lancedb_table_name}")
+    logger.info("LanceDB table name: %s", lancedb_table_name)
     
     engine = AiEngine(planning, project_taskmgr, lancedb_table, lancedb_table_name, project_audit)
     log_success(logger, "AI engine created")
@@ -106,20 +118,20 @@ def scan_project(project, db_engine):
     planning_start = time.time()
     engine.do_planning()
     planning_duration = time.time() - planning_start
-    log_success(logger, "Project planning completed", f"Duration: {planning_duration:.2f}s")
+    log_success(logger, "Project planning completed", "Duration: %.2fs", planning_duration)
     
     log_step(logger, "Execute vulnerability scan (reasoning)")
     scan_start = time.time()
     engine.do_scan()
     scan_duration = time.time() - scan_start
-    log_success(logger, "Vulnerability scan (reasoning) completed", f"Duration: {scan_duration:.2f}s")
+    log_success(logger, "Vulnerability scan (reasoning) completed", "Duration: %.2fs", scan_duration)
     
     # deduplicate after reasoning before validation
     log_step(logger, "Post-reasoning deduplication")
     dedup_start = time.time()
     ResProcessor.perform_post_reasoning_deduplication(project.id, db_engine, logger)
     dedup_duration = time.time() - dedup_start
-    log_success(logger, "Post-reasoning deduplication completed", f"Duration: {dedup_duration:.2f}s")
+    log_success(logger, "Post-reasoning deduplication completed", "Duration: %.2fs", dedup_duration)
     
     total_scan_duration = time.time() - scan_start_time
     log_section_end(logger, "Project scan", total_scan_duration)
@@ -131,10 +143,10 @@ def check_function_vul(engine, lancedb, lance_table_name, project_audit):
     logger = get_logger("check_function_vul")
     check_start_time = time.time()
     
-    log_section_start(logger, "Vulnerability verification", f"Project ID: {project_audit.project_id}")
+    log_section_start(logger, "Vulnerability verification", "Project ID: %s", project_audit.project_id)
     
     log_step(logger, "Create project task manager")
-    project_taskmgr = ProjectTaskMgr(project_audit.project_id, engine)
+    project_taskmgr = get_project_taskmgr(project_audit.project_id, engine)
     log_success(logger, "Project task manager created")
     
     # directly create vulnerability checker with project_audit
@@ -148,7 +160,7 @@ def check_function_vul(engine, lancedb, lance_table_name, project_audit):
     validation_start = time.time()
     checker.check_function_vul(project_taskmgr)
     validation_duration = time.time() - validation_start
-    log_success(logger, "Vulnerability verification completed", f"Duration: {validation_duration:.2f}s")
+    log_success(logger, "Vulnerability verification completed", "Duration: %.2fs", validation_duration)
     
     total_check_duration = time.time() - check_start_time
     log_section_end(logger, "Vulnerability verification", total_check_duration)
@@ -161,12 +173,12 @@ if __name__ == '__main__':
     main_start_time = time.time()
     
     main_logger.info("🎯 Program startup parameters:")
-    main_logger.info(f"   Python version: {sys.version}")
-    main_logger.info(f"   Working directory: {os.getcwd()}")
-    main_logger.info(f"   Environment variables loaded")
+    main_logger.info("   Python version: %s", sys.version)
+    main_logger.info("   Working directory: %s", os.getcwd())
+    main_logger.info("   Environment variables loaded")
 
     switch_production_or_test = 'test' # test / direct_excel
-    main_logger.info(f"Run mode: {switch_production_or_test}")
+    main_logger.info("Run mode: %s", switch_production_or_test)
 
     if switch_production_or_test == 'direct_excel':
         log_section_start(main_logger, "Direct Excel generation mode")
@@ -176,20 +188,20 @@ if __name__ == '__main__':
         # initialize database
         log_step(main_logger, "Initialize database connection")
         db_url_from = os.environ.get("DATABASE_URL")
-        main_logger.info(f"Database URL: {db_url_from}")
+        main_logger.info("Database URL: %s", db_url_from)
         engine = create_engine(db_url_from)
         log_success(main_logger, "Database connection created")
         
         # set project parameters
         project_id = 'token0902'  # existing project ID
-        main_logger.info(f"Target project ID: {project_id}")
+        main_logger.info("Target project ID: %s", project_id)
         
         # generate Excel directly
         log_step(main_logger, "Generate Excel report via ResProcessor")
         excel_start = time.time()
         ResProcessor.generate_excel("./output_direct.xlsx", project_id, engine)
         excel_duration = time.time() - excel_start
-        log_success(main_logger, "Excel report generated", f"Duration: {excel_duration:.2f}s, file: ./output_direct.xlsx")
+        log_success(main_logger, "Excel report generated", "Duration: %.2fs, file: ./output_direct.xlsx", excel_duration)
         
         total_duration = time.time() - start_time
         log_section_end(main_logger, "Direct Excel generation mode", total_duration)
@@ -202,51 +214,51 @@ if __name__ == '__main__':
         # initialize database
         log_step(main_logger, "Initialize database connection")
         db_url_from = os.environ.get("DATABASE_URL")
-        main_logger.info(f"Database URL: {db_url_from}")
+        main_logger.info("Database URL: %s", db_url_from)
         engine = create_engine(db_url_from)
         log_success(main_logger, "Database connection created")
         
         # load dataset
         log_step(main_logger, "Load dataset")
         dataset_base = "./src/dataset/agent-v1-c4"
-        main_logger.info(f"Dataset path: {dataset_base}")
+        main_logger.info("Dataset path: %s", dataset_base)
         projects = load_dataset(dataset_base)
-        log_success(main_logger, "Dataset loaded", f"Found {len(projects)} projects")
+        log_success(main_logger, "Dataset loaded", "Found %d projects", len(projects))
  
         # set project parameters
         project_id = 'moonlith3'  # existing project ID
         project_path = ''
-        main_logger.info(f"Target project ID: {project_id}")
+        main_logger.info("Target project ID: %s", project_id)
         project = Project(project_id, projects[project_id])
         log_success(main_logger, "Project object created")
         
         # check scan mode
         scan_mode = os.getenv("SCAN_MODE","SPECIFIC_PROJECT")
-        main_logger.info(f"Scan mode: {scan_mode}")
+        main_logger.info("Scan mode: %s", scan_mode)
         
         cmd = 'detect_vul'
-        main_logger.info(f"Executing command: {cmd}")
+        main_logger.info("Executing command: %s", cmd)
         
         if cmd == 'detect_vul':
             # run project scan
             lancedb, lance_table_name, project_audit = scan_project(project, engine)
             
             if scan_mode in ["COMMON_PROJECT", "PURE_SCAN", "CHECKLIST", "COMMON_PROJECT_FINE_GRAINED"]:
-                main_logger.info(f"Scan mode '{scan_mode}' requires vulnerability verification")
+                main_logger.info("Scan mode '%s' requires vulnerability verification", scan_mode)
                 check_function_vul(engine, lancedb, lance_table_name, project_audit)
             else:
-                main_logger.info(f"Scan mode '{scan_mode}' skips vulnerability verification")
+                main_logger.info("Scan mode '%s' skips vulnerability verification", scan_mode)
 
         # total execution time
         end_time=time.time()
         total_duration = end_time-start_time
-        log_success(main_logger, "All scanning tasks completed", f"Total duration: {total_duration:.2f}s")
+        log_success(main_logger, "All scanning tasks completed", "Total duration: %.2fs", total_duration)
         
         # generate Excel report
         log_step(main_logger, "Generate Excel report")
         excel_start = time.time()
         ResProcessor.generate_excel("./output.xlsx", project_id, engine)
         excel_duration = time.time() - excel_start
-        log_success(main_logger, "Excel report generated", f"Duration: {excel_duration:.2f}s, file: ./output.xlsx")
+        log_success(main_logger, "Excel report generated", "Duration: %.2fs, file: ./output.xlsx", excel_duration)
         
         log_section_end(main_logger, "Test mode execution", time.time() - main_start_time)
@@ -8,6 +8,12 @@ from openai import OpenAI
 # 全局模型配置缓存
 _model_config = None
 
+# ```json ... ``` 代码块匹配
+_JSON_BLOCK_RE = re.compile(r'```json(.*?)```', re.DOTALL)
+
+# 批量embedding请求因输入本身被拒绝的状态码，只有这些情况才逐条回退
+_BATCH_REJECTED_STATUS_CODES = (400, 413, 422)
+
 def get_model(model_key: str) -> str:
     """直接从JSON读取模型名称"""
     global _model_config
@@ -16,7 +22,7 @@ def get_model(model_key: str) -> str:
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 _model_config = json.load(f)
-        except:
+        except (OSError, ValueError):
             _model_config = {}
     
     return _model_config.get(model_key, 'gpt-4o-mini')
@@ -119,9 +125,8 @@ def ask_openai_for_json(prompt):
     return cleaned_json
 
 def extract_json_string(response):
-    json_pattern = re.compile(r'```json(.*?)```', re.DOTALL)
     response = response.strip()
-    extracted_json = re.findall(json_pattern, response)
+    extracted_json = _JSON_BLOCK_RE.findall(response)
     if len(extracted_json) > 1:
         print("[DEBUG]⚠️Error json string:")
         print(response)
@@ -255,7 +260,15 @@ def ask_deepseek(prompt):
 def clean_text(text: str) -> str:
     return str(text).replace(" ", "").replace("\n", "").replace("\r", "")
 
-def common_get_embedding(text: str):
+def _zero_embedding():
+    """embedding请求失败时的占位向量：长度为3072的全0数组"""
+    return list(np.zeros(3072))
+
+def _request_embeddings(embedding_input):
+    """调用embedding接口，返回响应中的data列表；input可以是单条文本或文本列表
+
+    请求失败时抛出requests异常，由调用方决定回退方式
+    """
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is not set")
@@ -268,22 +281,47 @@ def common_get_embedding(text: str):
         "Content-Type": "application/json"
     }
 
-    cleaned_text = clean_text(text)
-    
     data = {
-        "input": cleaned_text,
+        "input": embedding_input,
         "model": model,
         "encoding_format": "float"
     }
 
+    response = requests.post(f'https://{api_base}/v1/embeddings', json=data, headers=headers)
+    response.raise_for_status()
+    return response.json()['data']
+
+def common_get_embedding(text: str):
+    try:
+        return _request_embeddings(clean_text(text))[0]['embedding']
+    except requests.exceptions.RequestException as e:
+        print(f"Error: {e}")
+        return _zero_embedding()
+
+def common_get_embeddings(texts):
+    """批量获取embedding：多条输入合并为一次请求，结果按输入顺序返回
+
+    接口以输入错误拒绝批量请求（400/413/422，如不支持列表input或请求过大的兼容代理）或返回条数不符时
+    逐条回退到common_get_embedding；连接错误、限流（429）、鉴权失败和5xx不逐条重试，直接返回全0向量
+    """
     try:
-        response = requests.post(f'https://{api_base}/v1/embeddings', json=data, headers=headers)
-        response.raise_for_status()
-        embedding_data = response.json()
-        return embedding_data['data'][0]['embedding']
+        embedding_data = _request_embeddings([clean_text(text) for text in texts])
+    except requests.exceptions.HTTPError as e:
+        if e.response is None or e.response.status_code not in _BATCH_REJECTED_STATUS_CODES:
+            print(f"Error: {e}")
+            return [_zero_embedding() for _ in texts]
+        print(f"Batch embedding rejected, falling back to single requests: {e}")
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}")
-        return list(np.zeros(3072))  # 返回长度为3072的全0数组
+        return [_zero_embedding() for _ in texts]
+    else:
+        try:
+            if len(embedding_data) == len(texts):
+                return [item['embedding'] for item in sorted(embedding_data, key=lambda item: item['index'])]
+        except (KeyError, TypeError):
+            pass
+        print("Unexpected batch embedding response, falling back to single requests")
+    return [common_get_embedding(text) for text in texts]
 
 
 # ========== 漏洞检测多轮分析专用函数 ==========
@@ -8,9 +8,10 @@
 - 多语言支持（Solidity, Rust, C++, Move）
 """
 
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 import json
 import os
+import re
 
 # 复杂度分析相关导入
 try:
@@ -44,6 +45,34 @@ except ImportError:
     MOVE_AVAILABLE = False
 
 
+# AST遍历中逐节点判断的类型/运算符集合
+_BINARY_EXPRESSION_TYPES = frozenset({'binary_expression', 'bin_op_expr'})
+_LOGICAL_OPERATORS = frozenset({'&&', '||', 'and', 'or'})
+
+# 基于实际案例的函数名模式：tokenURI、buyFcc、updateNft 及 URI 相关函数
+_REDUCE_ITERATION_NAME_RE = re.compile(r'tokenURI|buyFcc|updateNft|uri\(')
+
+# 各语言的决策节点类型，只在模块加载时构建一次
+_DECISION_NODE_TYPES = {
+    'solidity': {
+        'control_flow': frozenset({'if_statement', 'while_statement', 'for_statement', 'try_statement'}),
+        'conditional': frozenset({'conditional_expression'})
+    },
+    'rust': {
+        'control_flow': frozenset({'if_expression', 'while_expression', 'for_expression', 'loop_expression', 'match_expression'}),
+        'conditional': frozenset({'if_let_expression'})
+    },
+    'cpp': {
+        'control_flow': frozenset({'if_statement', 'while_statement', 'for_statement', 'do_statement', 'switch_statement'}),
+        'conditional': frozenset({'conditional_expression'})
+    },
+    'move': {
+        'control_flow': frozenset({'if_expr', 'while_expr', 'for_expr', 'loop_expr', 'match_expr'}),
+        'conditional': frozenset()
+    }
+}
+
+
 class ComplexityCalculator:
     """复杂度计算器类"""
     
@@ -150,19 +179,19 @@ class ComplexityCalculator:
                 complexity += 1
             elif node.type in decision_nodes['conditional']:  # 三元运算符
                 complexity += 1
-            elif node.type in ['binary_expression', 'bin_op_expr']:
+            elif node.type in _BINARY_EXPRESSION_TYPES:
                 # 检查逻辑运算符
                 operator = node.child_by_field_name('operator')
                 if operator:
                     operator_text = operator.text.decode('utf8')
-                    if operator_text in ['&&', '||', 'and', 'or']:
+                    if operator_text in _LOGICAL_OPERATORS:
                         complexity += 1
                 else:
                     # Move语言中可能需要遍历子节点寻找操作符
                     for child in node.children:
                         if child.type == 'binary_operator':
                             operator_text = child.text.decode('utf8')
-                            if operator_text in ['&&', '||', 'and', 'or']:
+                            if operator_text in _LOGICAL_OPERATORS:
                                 complexity += 1
                                 break
         
@@ -185,16 +214,16 @@ class ComplexityCalculator:
                     complexity += calculate_recursive(child, nesting_level + 1)
             elif node_type in decision_nodes['conditional']:
                 complexity += 1 + nesting_level
-            elif node_type in ['binary_expression', 'bin_op_expr']:
+            elif node_type in _BINARY_EXPRESSION_TYPES:
                 operator = node.child_by_field_name('operator')
-                if operator and operator.text.decode('utf8') in ['&&', '||', 'and', 'or']:
+                if operator and operator.text.decode('utf8') in _LOGICAL_OPERATORS:
                     complexity += 1
                 else:
                     # Move语言中可能需要遍历子节点寻找操作符
                     for child in node.children:
                         if child.type == 'binary_operator':
                             operator_text = child.text.decode('utf8')
-                            if operator_text in ['&&', '||', 'and', 'or']:
+                            if operator_text in _LOGICAL_OPERATORS:
                                 complexity += 1
                                 break
                 # 不增加嵌套层级处理逻辑运算符
@@ -209,28 +238,9 @@ class ComplexityCalculator:
         
         return calculate_recursive(function_node)
     
-    def _get_decision_node_types(self, language: str) -> Dict[str, List[str]]:
+    def _get_decision_node_types(self, language: str) -> Dict[str, FrozenSet[str]]:
         """获取不同语言的决策节点类型"""
-        node_types = {
-            'solidity': {
-                'control_flow': ['if_statement', 'while_statement', 'for_statement', 'try_statement'],
-                'conditional': ['conditional_expression']
-            },
-            'rust': {
-                'control_flow': ['if_expression', 'while_expression', 'for_expression', 'loop_expression', 'match_expression'],
-                'conditional': ['if_let_expression']
-            },
-            'cpp': {
-                'control_flow': ['if_statement', 'while_statement', 'for_statement', 'do_statement', 'switch_statement'],
-                'conditional': ['conditional_expression']
-            },
-            'move': {
-                'control_flow': ['if_expr', 'while_expr', 'for_expr', 'loop_expr', 'match_expr'],
-                'conditional': []
-            }
-        }
-        
-        return node_types.get(language, node_types['solidity'])  # 默认使用solidity的节点类型
+        return _DECISION_NODE_TYPES.get(language, _DECISION_NODE_TYPES['solidity'])  # 默认使用solidity的节点类型
     
     def _should_reduce_iterations(self, cognitive: int, cyclomatic: int, function_content: str) -> bool:
         """判断是否应该降低迭代次数（基于fishcake项目分析）
@@ -276,13 +286,8 @@ class ComplexityCalculator:
             'nonReentrant' in function_content and cyclomatic > 6,  # 复杂的防重入函数
         ]
         
-        # 5. 函数名模式识别 (基于实际案例)
-        function_name_patterns = [
-            'tokenURI' in function_content,  # 类似tokenURI的函数
-            'buyFcc' in function_content,  # 类似buyFcc的函数  
-            'updateNft' in function_content,  # 类似updateNft的函数
-            'uri(' in function_content,  # URI相关函数
-        ]
+        # 5. 函数名模式识别 (基于实际案例)，一次正则扫描代替逐个子串查找
+        matches_pattern = _REDUCE_ITERATION_NAME_RE.search(function_content) is not None
         
         # 判断逻辑：
         # - 是数据处理型 OR 简单交易型
@@ -292,7 +297,6 @@ class ComplexityCalculator:
         is_data_processing = sum(data_processing_indicators) >= 2
         is_simple_transaction = sum(simple_transaction_indicators) >= 2  
         has_complex_business = any(complex_business_indicators)
-        matches_pattern = any(function_name_patterns)
         
         # 决策逻辑
         should_reduce = (
@@ -648,7 +648,7 @@ class ResProcessor:
                     fallback_json = '{"group_1":[]}'
                     print("Debug - Using fallback JSON")
                     return fallback_json
-            except:
+            except AttributeError:
                 pass
             
             raise ValueError(f"Failed to extract valid JSON after all strategies: {str(e)}")
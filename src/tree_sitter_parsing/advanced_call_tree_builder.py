@@ -32,7 +32,7 @@ class AdvancedCallTreeBuilder:
             try:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
-            except:
+            except OSError:
                 pass
     
     def _detect_language_from_file_path(self, file_path: str) -> Optional[LanguageType]:
@@ -114,7 +114,7 @@ class AdvancedCallTreeBuilder:
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
-                except:
+                except (OSError, UnicodeDecodeError):
                     # 如果无法读取，使用函数内容拼接
                     content = self._reconstruct_file_content(funcs, file_path)
             else:
@@ -147,27 +147,30 @@ class AdvancedCallTreeBuilder:
         
         return files_map
     
-    def _map_analyzer_to_original_function(self, analyzer_func_name: str, func_map: Dict) -> str:
+    def _build_simple_name_index(self, func_map: Dict) -> Dict[str, str]:
+        """构建 简单函数名 -> 原始函数名 的索引
+        
+        与逐个扫描func_map的匹配规则一致：原始函数名等于简单名称，或以".简单名称"结尾；
+        同一简单名称对应多个原始函数时取func_map中最先出现的那个。
+        """
+        simple_name_index = {}
+        for original_func_name in func_map.keys():
+            simple_name_index.setdefault(original_func_name.split('.')[-1], original_func_name)
+        return simple_name_index
+    
+    def _map_analyzer_to_original_function(self, analyzer_func_name: str, simple_name_index: Dict[str, str]) -> str:
         """将分析器的函数名映射回原始函数名"""
         if not analyzer_func_name:
             return None
         
-        # 提取函数的简单名称（最后一个.后面的部分）
-        simple_func_name = analyzer_func_name.split('.')[-1]
-        
-        # 在func_map中查找匹配的原始函数名
-        for original_func_name in func_map.keys():
-            # 检查原始函数名是否以simple_func_name结尾
-            if original_func_name.endswith('.' + simple_func_name) or original_func_name == simple_func_name:
-                return original_func_name
-        
-        return None
+        # 提取函数的简单名称（最后一个.后面的部分）并查索引
+        return simple_name_index.get(analyzer_func_name.split('.')[-1])
     
     def _reconstruct_file_content(self, funcs: List[Dict], file_path: str) -> str:
         """重构文件内容"""
         language = self._detect_language_from_file_path(file_path)
         
-        if language == LanguageType.SOLIDITY:
+        if language is LanguageType.SOLIDITY:
             # 为Solidity重构
             content = "pragma solidity ^0.8.0;\n\n"
             
@@ -188,7 +191,7 @@ class AdvancedCallTreeBuilder:
                         content += f"    {func_content}\n\n"
                 content += "}\n\n"
                 
-        elif language == LanguageType.RUST:
+        elif language is LanguageType.RUST:
             # 为Rust重构
             content = "// Rust module\n\n"
             for func in funcs:
@@ -196,7 +199,7 @@ class AdvancedCallTreeBuilder:
                 if func_content:
                     content += f"{func_content}\n\n"
                     
-        elif language == LanguageType.CPP:
+        elif language is LanguageType.CPP:
             # 为C++重构
             content = "#include <iostream>\n\n"
             for func in funcs:
@@ -204,7 +207,7 @@ class AdvancedCallTreeBuilder:
                 if func_content:
                     content += f"{func_content}\n\n"
                     
-        elif language == LanguageType.MOVE:
+        elif language is LanguageType.MOVE:
             # 为Move重构
             content = "module 0x1::Module {\n"
             for func in funcs:
@@ -247,6 +250,9 @@ class AdvancedCallTreeBuilder:
                 relationships['upstream'][func_name] = set()
                 relationships['downstream'][func_name] = set()
             
+            # 调用图中的函数名会反复出现，预先建立简单名称索引，避免每条边都线性扫描func_map
+            simple_name_index = self._build_simple_name_index(func_map)
+            
             # 使用语言分析器分析每个文件
             for original_path in tqdm(original_files_map.keys(), desc="分析文件调用关系"):
                 try:
@@ -265,8 +271,8 @@ class AdvancedCallTreeBuilder:
                             callee = edge.callee
                             
                             # 将分析器的函数名映射回原始函数名
-                            original_caller = self._map_analyzer_to_original_function(caller, func_map)
-                            original_callee = self._map_analyzer_to_original_function(callee, func_map)
+                            original_caller = self._map_analyzer_to_original_function(caller, simple_name_index)
+                            original_callee = self._map_analyzer_to_original_function(callee, simple_name_index)
                             
                             # 检查函数是否在我们的分析列表中
                             if original_caller and original_callee and original_caller in func_map and original_callee in func_map:
@@ -305,6 +311,8 @@ class AdvancedCallTreeBuilder:
             relationships['upstream'][func_name] = set()
             relationships['downstream'][func_name] = set()
         
+        simple_name_index = self._build_simple_name_index(func_map)
+        
         # 使用函数中的calls信息和启发式搜索
         for func in functions_to_check:
             func_name = func['name']  # 使用完整的函数名（包括合约名）
@@ -315,11 +323,7 @@ class AdvancedCallTreeBuilder:
                     clean_called_func = called_func if called_func in func_map else None
                     # 如果直接查找失败，尝试只用函数名部分匹配
                     if not clean_called_func:
-                        func_name_only = called_func.split('.')[-1] if '.' in called_func else called_func
-                        for full_name in func_map.keys():
-                            if full_name.split('.')[-1] == func_name_only:
-                                clean_called_func = full_name
-                                break
+                        clean_called_func = simple_name_index.get(called_func.split('.')[-1])
                     
                     if clean_called_func and clean_called_func in func_map and clean_called_func != func_name:
                         relationships['downstream'][func_name].add(clean_called_func)
@@ -12,8 +12,8 @@ Tree-sitter Based Call Tree Builder
 import re
 import os
 import sys
+from functools import lru_cache
 from typing import List, Dict, Set, Tuple, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
 # 添加路径以便导入
@@ -36,6 +36,16 @@ except ImportError:
         print("⚠️ 高级调用树构建器不可用，使用简化实现")
 
 
+@lru_cache(maxsize=4096)
+def _call_pattern(func_name: str):
+    """按函数名编译并缓存调用检测正则
+    
+    直接调用、成员调用两种模式的匹配都包含"函数名 + ("的简单调用匹配，
+    因此合并为单个模式，每段内容只需扫描一次。
+    """
+    return re.compile(rf'{re.escape(func_name.lower())}\s*\(')
+
+
 class SimplifiedCallTreeBuilder:
     """简化的调用树构造器（备选实现，使用正则表达式）"""
     
@@ -61,10 +71,13 @@ class SimplifiedCallTreeBuilder:
         
         print(f"🔍 分析 {len(functions_to_check)} 个函数的调用关系...")
         
+        # 内容小写只计算一次，内层两两比较时直接复用
+        lowered_contents = [func.get('content', '').lower() for func in functions_to_check]
+        
         # 分析每个函数的调用关系
-        for func in tqdm(functions_to_check, desc="分析函数调用关系"):
+        for func_idx, func in enumerate(tqdm(functions_to_check, desc="分析函数调用关系")):
             func_name = func['name']  # 使用完整的函数名（包括合约名）
-            content = func.get('content', '').lower()
+            content = lowered_contents[func_idx]
             
             if func_name not in relationships['upstream']:
                 relationships['upstream'][func_name] = set()
@@ -85,12 +98,12 @@ class SimplifiedCallTreeBuilder:
                         relationships['upstream'][clean_called_func].add(func_name)
             
             # 额外的启发式搜索（作为备选方案）
-            for other_func in functions_to_check:
-                if other_func == func:
+            for other_idx, other_func in enumerate(functions_to_check):
+                if other_idx == func_idx:
                     continue
                     
                 other_name = other_func['name']  # 使用完整的函数名（包括合约名） 
-                other_content = other_func.get('content', '').lower()
+                other_content = lowered_contents[other_idx]
                 
                 # 检查其他函数是否调用了当前函数（避免自引用）
                 if other_name != func_name and self._is_function_called_in_content(func_name, other_content):
@@ -111,14 +124,7 @@ class SimplifiedCallTreeBuilder:
     
     def _is_function_called_in_content(self, func_name: str, content: str) -> bool:
         """更精确的函数调用检测"""
-        # 多种模式匹配
-        patterns = [
-            rf'\b{re.escape(func_name.lower())}\s*\(',  # 直接调用
-            rf'\.{re.escape(func_name.lower())}\s*\(',  # 成员调用
-            rf'{re.escape(func_name.lower())}\s*\(',    # 简单调用
-        ]
-        
-        return any(re.search(pattern, content) for pattern in patterns)
+        return _call_pattern(func_name).search(content) is not None
     
     def build_call_tree(self, func_name: str, relationships: Dict, direction: str, func_map: Dict, visited: Set = None) -> Dict:
         """构建调用树"""
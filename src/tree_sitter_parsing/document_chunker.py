@@ -41,6 +41,21 @@ except ImportError:
         print("⚠️  无法导入chunk_config，将使用基础配置")
 
 
+# 章节标记相关正则，模块加载时编译一次
+_CHAPTER_MARKER_RE = re.compile(
+    r'第[一二三四五六七八九十\d]+章'    # 中文章节
+    r'|Chapter\s+\d+'                 # 英文章节
+    r'|^#{1,3}\s+'                    # Markdown标题
+    r'|^\d+\.\s+[A-Z]',               # 数字标题
+    re.MULTILINE
+)
+_CHAPTER_SEPARATION_RULES = [
+    (re.compile(r'(第[一二三四五六七八九十\d]+章)'), r'\n\n\1'),
+    (re.compile(r'(Chapter\s+\d+)'), r'\n\n\1'),
+    (re.compile(r'^(#{1,3}\s+)', re.MULTILINE), r'\n\n\1'),
+]
+
+
 @dataclass
 class ChunkResult:
     """分块结果数据结构"""
@@ -479,30 +494,13 @@ class DocumentChunker:
     
     def _detect_chapter_markers(self, content: str) -> bool:
         """检测是否有章节标记"""
-        chapter_patterns = [
-            r'第[一二三四五六七八九十\d]+章',  # 中文章节
-            r'Chapter\s+\d+',                   # 英文章节
-            r'^#{1,3}\s+',                      # Markdown标题
-            r'^\d+\.\s+[A-Z]',                 # 数字标题
-        ]
-        
-        for pattern in chapter_patterns:
-            if re.search(pattern, content, re.MULTILINE):
-                return True
-        return False
+        return _CHAPTER_MARKER_RE.search(content) is not None
     
     def _enhance_chapter_separation(self, content: str) -> str:
         """增强章节分隔"""
         # 在章节标题前添加额外的分隔
-        patterns = [
-            (r'(第[一二三四五六七八九十\d]+章)', r'\n\n\1'),
-            (r'(Chapter\s+\d+)', r'\n\n\1'),
-            (r'^(#{1,3}\s+)', r'\n\n\1', re.MULTILINE),
-        ]
-        
-        for pattern, replacement, *flags in patterns:
-            flag = flags[0] if flags else 0
-            content = re.sub(pattern, replacement, content, flags=flag)
+        for pattern, replacement in _CHAPTER_SEPARATION_RULES:
+            content = pattern.sub(replacement, content)
         
         return content
 
@@ -7,21 +7,21 @@ Tree-sitter Based Project Audit
 """
 
 import csv
-import re
+import hashlib
 import os
+import pickle
 import sys
 from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 添加路径以便导入
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 try:
-    from .project_parser import parse_project, TreeSitterProjectFilter
+    from .project_parser import parse_project, get_ignore_folders, TreeSitterProjectFilter
     from .call_tree_builder import TreeSitterCallTreeBuilder
 except ImportError:
     # 如果相对导入失败，尝试直接导入
-    from project_parser import parse_project, TreeSitterProjectFilter
+    from project_parser import parse_project, get_ignore_folders, TreeSitterProjectFilter
     from call_tree_builder import TreeSitterCallTreeBuilder
 
 # 导入call_graph相关模块
@@ -35,6 +35,21 @@ try:
 except ImportError:
     LOGGING_AVAILABLE = False
 
+# 文件后缀 -> 语言类型，用于 _detect_project_languages 的单次目录遍历
+_LANGUAGE_BY_SUFFIX = {
+    '.sol': LanguageType.SOLIDITY,
+    '.rs': LanguageType.RUST,
+    '.cpp': LanguageType.CPP,
+    '.cc': LanguageType.CPP,
+    '.cxx': LanguageType.CPP,
+    '.move': LanguageType.MOVE,
+    '.go': LanguageType.GO,
+}
+_DETECTED_LANGUAGES = tuple(dict.fromkeys(_LANGUAGE_BY_SUFFIX.values()))
+
+# 解析结果磁盘缓存的格式版本，解析输出结构变化时递增以使旧缓存失效
+_PARSE_CACHE_VERSION = 1
+
 
 class TreeSitterProjectAudit(object):
     """基于tree-sitter的项目审计器"""
@@ -70,7 +85,15 @@ class TreeSitterProjectAudit(object):
     def parse(self):
         """
         解析项目文件并构建调用树
+
+        ENABLE_PARSE_CACHE=true 时，源码树未变化（路径、mtime、大小一致）则直接加载上次的解析结果
         """
+        cache_path = None
+        if os.getenv('ENABLE_PARSE_CACHE', 'false').lower() == 'true':
+            cache_path = self._parse_cache_path()
+            if self._load_parse_cache(cache_path):
+                return
+        
         if self.logger:
             log_step(self.logger, "创建项目过滤器")
         
@@ -106,6 +129,92 @@ class TreeSitterProjectAudit(object):
         
         # 构建 call graph
         self._build_call_graphs()
+        
+        if cache_path:
+            self._save_parse_cache(cache_path)
+
+    def _parse_cache_path(self):
+        """根据项目ID、项目路径、当前工作目录和源码树的文件状态（相对路径、mtime、大小）计算解析缓存文件路径
+
+        与parse_project共用get_ignore_folders()，跳过的目录变化不影响解析结果
+        """
+        ignore_folders = get_ignore_folders()
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        # 缓存的函数信息中file_path按传入的project_path拼接、relative_file_path相对于当前工作目录、
+        # absolute_file_path依赖项目绝对路径，因此三者都参与计算
+        hasher.update(f"{_PARSE_CACHE_VERSION}|{self.project_id}|{self.project_path}|"
+                      f"{os.path.abspath(self.project_path)}|{os.getcwd()}|"
+                      f"{','.join(sorted(ignore_folders))}".encode())
+        for dirpath, dirs, files in os.walk(self.project_path):
+            dirs[:] = sorted(d for d in dirs if d not in ignore_folders)
+            for name in sorted(files):
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                rel_path = os.path.relpath(path, self.project_path)
+                hasher.update(f"{rel_path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+        
+        cache_dir = os.getenv('PARSE_CACHE_DIR', os.path.join('.cache', 'parse'))
+        return os.path.join(cache_dir, f"parse_{self.project_id}_{hasher.hexdigest()}.pkl")
+
+    def _load_parse_cache(self, cache_path):
+        """加载解析缓存，命中返回True"""
+        try:
+            with open(cache_path, 'rb') as f:
+                (self.functions, self.functions_to_check, self.chunks,
+                 self.call_trees, self.call_graphs) = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            if self.logger:
+                log_warning(self.logger, f"解析缓存读取失败，重新解析: {e}")
+            else:
+                print(f"⚠️ 解析缓存读取失败，重新解析: {e}")
+            return False
+        
+        if self.logger:
+            log_success(self.logger, "命中解析缓存，跳过项目解析", cache_path)
+            log_data_info(self.logger, "待检查函数数", len(self.functions_to_check))
+        else:
+            print(f"✅ 命中解析缓存，跳过项目解析: {cache_path}")
+        return True
+
+    def _save_parse_cache(self, cache_path):
+        """写入解析缓存（先写临时文件再替换，避免留下不完整的缓存）"""
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((self.functions, self.functions_to_check, self.chunks,
+                             self.call_trees, self.call_graphs), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            self._evict_stale_parse_caches(cache_path)
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if self.logger:
+                log_warning(self.logger, f"解析缓存写入失败: {e}")
+            else:
+                print(f"⚠️ 解析缓存写入失败: {e}")
+
+    def _evict_stale_parse_caches(self, cache_path):
+        """删除本项目旧的解析缓存，每个项目只保留最新的一份"""
+        cache_dir, current_name = os.path.split(cache_path)
+        prefix = f"parse_{self.project_id}_"
+        for name in os.listdir(cache_dir):
+            if name == current_name or not (name.startswith(prefix) and name.endswith('.pkl')):
+                continue
+            # 只匹配 parse_{project_id}_{32位hash}.pkl，避免误删ID以本项目ID为前缀的其他项目的缓存
+            digest = name[len(prefix):-len('.pkl')]
+            if len(digest) != 32 or any(c not in '0123456789abcdef' for c in digest):
+                continue
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
 
     def get_function_names(self):
         """获取所有函数名称"""
@@ -206,36 +315,24 @@ class TreeSitterProjectAudit(object):
             self.call_graphs = []
     
     def _detect_project_languages(self):
-        """检测项目中的语言类型"""
+        """检测项目中的语言类型（单次遍历项目目录）"""
         from pathlib import Path
         language_paths = {}
         
         project_path = Path(self.project_path)
         
-        # 检测 Solidity 文件
-        sol_files = list(project_path.rglob('*.sol'))
-        if sol_files:
-            language_paths[LanguageType.SOLIDITY] = [str(project_path)]
-        
-        # 检测 Rust 文件
-        rs_files = list(project_path.rglob('*.rs'))
-        if rs_files:
-            language_paths[LanguageType.RUST] = [str(project_path)]
-        
-        # 检测 C++ 文件
-        cpp_files = list(project_path.rglob('*.cpp')) + list(project_path.rglob('*.cc')) + list(project_path.rglob('*.cxx'))
-        if cpp_files:
-            language_paths[LanguageType.CPP] = [str(project_path)]
-        
-        # 检测 Move 文件
-        move_files = list(project_path.rglob('*.move'))
-        if move_files:
-            language_paths[LanguageType.MOVE] = [str(project_path)]
-        
-        # 检测 Go 文件
-        go_files = list(project_path.rglob('*.go'))
-        if go_files:
-            language_paths[LanguageType.GO] = [str(project_path)]
+        found_languages = set()
+        for file_path in project_path.rglob('*'):
+            language = _LANGUAGE_BY_SUFFIX.get(file_path.suffix)
+            if language is not None:
+                found_languages.add(language)
+                if len(found_languages) == len(_DETECTED_LANGUAGES):
+                    break
+        
+        # 保持 Solidity / Rust / C++ / Move / Go 的检测顺序
+        for language in _DETECTED_LANGUAGES:
+            if language in found_languages:
+                language_paths[language] = [str(project_path)]
         
         return language_paths
     
@@ -573,7 +573,7 @@ def _parse_move_function(node: Node, source_code: bytes, file_path: str) -> Opti
                 colon_part = func_content.split(':')[1].split('{')[0].strip()
                 if colon_part and not return_type:
                     return_type = colon_part
-            except:
+            except IndexError:
                 pass
         
         # 检查native修饰符
@@ -675,6 +675,15 @@ def _parse_go_function(node: Node, source_code: bytes, file_path: str) -> Option
         return None
 
 
+def get_ignore_folders():
+    """返回遍历项目时跳过的目录名集合（IGNORE_FOLDERS环境变量 + .git）"""
+    ignore_folders = set()
+    if os.environ.get('IGNORE_FOLDERS'):
+        ignore_folders = set(os.environ.get('IGNORE_FOLDERS').split(','))
+    ignore_folders.add('.git')
+    return ignore_folders
+
+
 def parse_project(project_path, project_filter=None):
     """
     使用tree-sitter解析项目
@@ -683,10 +692,7 @@ def parse_project(project_path, project_filter=None):
     if project_filter is None:
         project_filter = TreeSitterProjectFilter([], [])
 
-    ignore_folders = set()
-    if os.environ.get('IGNORE_FOLDERS'):
-        ignore_folders = set(os.environ.get('IGNORE_FOLDERS').split(','))
-    ignore_folders.add('.git')
+    ignore_folders = get_ignore_folders()
 
     all_results = []
     all_file_paths = []  # 收集所有文件路径用于分块
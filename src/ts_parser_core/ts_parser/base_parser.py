@@ -44,15 +44,15 @@ class BaseParser(ABC):
         parser = Parser()
         
         # 根据语言类型设置对应的解析器
-        if self.language == LanguageType.SOLIDITY:
+        if self.language is LanguageType.SOLIDITY:
             language = Language(ts_solidity.language())
-        elif self.language == LanguageType.RUST:
+        elif self.language is LanguageType.RUST:
             language = Language(ts_rust.language())
-        elif self.language == LanguageType.CPP:
+        elif self.language is LanguageType.CPP:
             language = Language(ts_cpp.language())
-        elif self.language == LanguageType.MOVE:
+        elif self.language is LanguageType.MOVE:
             language = Language(ts_move.language())
-        elif self.language == LanguageType.GO:
+        elif self.language is LanguageType.GO:
             language = Language(ts_go.language())
         else:
             raise ValueError(f"Unsupported language: {self.language}")
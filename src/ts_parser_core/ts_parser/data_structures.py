@@ -5,10 +5,15 @@
 Data structure definitions used by the multi-language analyzer.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
+# Parse results are created in bulk, so they use __slots__ instead of a per-instance
+# __dict__. dataclass(slots=...) needs Python 3.10+; older interpreters get plain dataclasses.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class LanguageType(Enum):
     """Supported programming languages."""
@@ -32,7 +37,7 @@ class CallType(Enum):
     MODIFIER = "modifier"          # Modifier invocation (Solidity)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionInfo:
     """Enhanced function information."""
     name: str
@@ -66,7 +71,7 @@ class FunctionInfo:
     properties: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StructInfo:
     """Enhanced structure/class information."""
     name: str
@@ -89,7 +94,7 @@ class StructInfo:
     properties: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModuleInfo:
     """Enhanced module information."""
     name: str
@@ -111,7 +116,7 @@ class ModuleInfo:
     properties: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CallGraphEdge:
     """Call-graph edge information."""
     caller: str
@@ -150,6 +150,13 @@ LANGUAGE_CONFIGS: Dict[LanguageType, LanguageConfig] = {
     LanguageType.GO: GO_CONFIG,
 }
 
+# Extension -> language lookup, built once from LANGUAGE_CONFIGS
+_LANGUAGE_BY_EXTENSION: Dict[str, LanguageType] = {
+    ext: language
+    for language, config in LANGUAGE_CONFIGS.items()
+    for ext in config.file_extensions
+}
+
 
 def get_language_config(language: LanguageType) -> LanguageConfig:
     """Get the configuration for a language."""
@@ -158,10 +165,10 @@ def get_language_config(language: LanguageType) -> LanguageConfig:
 
 def get_language_by_extension(file_extension: str) -> LanguageType:
     """Determine language by file extension."""
-    for language, config in LANGUAGE_CONFIGS.items():
-        if file_extension.lower() in config.file_extensions:
-            return language
-    raise ValueError(f"Unsupported file extension: {file_extension}")
+    language = _LANGUAGE_BY_EXTENSION.get(file_extension.lower())
+    if language is None:
+        raise ValueError(f"Unsupported file extension: {file_extension}")
+    return language
 
 
 def is_visibility_keyword(language: LanguageType, keyword: str) -> bool:
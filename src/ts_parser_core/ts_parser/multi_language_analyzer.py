@@ -8,9 +8,6 @@
 
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import networkx as nx
 from datetime import datetime
 
 from .data_structures import (
@@ -449,6 +446,11 @@ class MultiLanguageAnalyzer:
             保存的文件路径（如果保存了）
         """
         try:
+            # 绘图依赖只在可视化时需要，延迟导入以免拖慢分析器的加载
+            import matplotlib.pyplot as plt
+            import matplotlib.patches as mpatches
+            import networkx as nx
+            
             # 获取依赖图数据
             dependency_graph = self.get_function_dependency_graph(function_name, language, max_depth)
             
@@ -468,9 +470,12 @@ class MultiLanguageAnalyzer:
             node_sizes = {}
             node_labels = {}
             
-            # 添加目标函数节点（中心节点）
+            # 节点与边先收集到列表中，最后批量加入图
             target_node = target_func.name
-            G.add_node(target_node)
+            nodes = [target_node]
+            edges = []
+            
+            # 添加目标函数节点（中心节点）
             node_colors[target_node] = '#FF6B6B'  # 红色 - 目标函数
             node_sizes[target_node] = 2000
             node_labels[target_node] = f"TARGET: {target_func.name}\n({target_func.visibility})"
@@ -490,26 +495,26 @@ class MultiLanguageAnalyzer:
             # 添加上游函数节点
             for func, depth in upstream.items():
                 short_name = func.split('.')[-1] if '.' in func else func
-                G.add_node(func)
+                nodes.append(func)
                 color_idx = min(depth - 1, len(upstream_colors) - 1)
                 node_colors[func] = upstream_colors[color_idx]
                 node_sizes[func] = max(800, 1500 - depth * 150)
                 node_labels[func] = f"UP: {short_name}\n(depth{depth})"
                 
                 # 添加边 - 上游函数指向目标函数
-                G.add_edge(func, target_node)
+                edges.append((func, target_node))
             
             # 添加下游函数节点
             for func, depth in downstream.items():
                 short_name = func.split('.')[-1] if '.' in func else func
-                G.add_node(func)
+                nodes.append(func)
                 color_idx = min(depth - 1, len(downstream_colors) - 1)
                 node_colors[func] = downstream_colors[color_idx]
                 node_sizes[func] = max(800, 1500 - depth * 150)
                 node_labels[func] = f"DOWN: {short_name}\n(depth{depth})"
                 
                 # 添加边 - 目标函数指向下游函数
-                G.add_edge(target_node, func)
+                edges.append((target_node, func))
             
             # 同时添加下游函数之间的调用关系
             call_graph = self.get_call_graph(language)
@@ -517,10 +522,12 @@ class MultiLanguageAnalyzer:
             
             for edge in call_graph:
                 if edge.caller in all_funcs and edge.callee in all_funcs:
-                    # 只添加不是直接连接到目标函数的边
+                    # 只添加不是直接连接到目标函数的边（其余端点均已在上/下游节点中）
                     if edge.caller != target_func.full_name and edge.callee != target_func.full_name:
-                        if edge.caller in G.nodes() and edge.callee in G.nodes():
-                            G.add_edge(edge.caller, edge.callee)
+                        edges.append((edge.caller, edge.callee))
+            
+            G.add_nodes_from(nodes)
+            G.add_edges_from(edges)
             
             # 创建图形
             plt.figure(figsize=(16, 12))
@@ -530,7 +537,7 @@ class MultiLanguageAnalyzer:
             try:
                 plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'SimHei', 'DejaVu Sans']
                 plt.rcParams['axes.unicode_minus'] = False
-            except:
+            except (KeyError, ValueError):
                 pass
             
             # 使用层次化布局
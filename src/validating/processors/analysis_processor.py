@@ -2,6 +2,7 @@ import os
 import time
 import json
 from datetime import datetime
+from itertools import chain, islice
 from typing import List, Tuple, Dict, Any
 import tiktoken
 
@@ -780,38 +781,19 @@ class AnalysisProcessor:
             return all_info
     
     def _merge_and_deduplicate_functions(self, name_results, content_results, natural_results, max_count):
-        """合并和去重函数搜索结果（三种类型）"""
+        """合并和去重函数搜索结果（三种类型），凑满max_count个即停止"""
         seen_names = set()
-        merged_results = []
         
-        # 先加入按名称搜索的结果
-        for result in name_results:
-            func_name = result.get('name', '')
-            if func_name and func_name not in seen_names:
-                seen_names.add(func_name)
-                merged_results.append(result)
-                if len(merged_results) >= max_count:
-                    break
-        
-        # 再加入按内容搜索的结果（去重）
-        for result in content_results:
-            func_name = result.get('name', '')
-            if func_name and func_name not in seen_names:
-                seen_names.add(func_name)
-                merged_results.append(result)
-                if len(merged_results) >= max_count:
-                    break
-        
-        # 最后加入按自然语言搜索的结果（去重）
-        for result in natural_results:
-            func_name = result.get('name', '')
-            if func_name and func_name not in seen_names:
-                seen_names.add(func_name)
-                merged_results.append(result)
-                if len(merged_results) >= max_count:
-                    break
+        def _unseen(results):
+            for result in results:
+                func_name = result.get('name', '')
+                if func_name and func_name not in seen_names:
+                    seen_names.add(func_name)
+                    yield result
         
-        return merged_results[:max_count]
+        # 按名称 -> 内容 -> 自然语言的优先级依次取结果
+        merged = chain(name_results, content_results, natural_results)
+        return list(islice(_unseen(merged), max(max_count, 0)))
     
     def _get_upstream_downstream_with_levels(self, task, upstream_level, downstream_level, logs, round_num):
         """获取上下游信息（复用planning中的实现）"""
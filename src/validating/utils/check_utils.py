@@ -20,7 +20,7 @@ class CheckUtils:
                 import json
                 scan_data = json.loads(task.scan_record)
                 business_flow_context = scan_data.get('business_flow_context', '')
-            except:
+            except (ValueError, TypeError, AttributeError):
                 pass
         
         # 如果有business_flow_code，使用它加上上下文，否则使用function_code
@@ -211,7 +211,7 @@ class CheckUtils:
             try:
                 import json
                 scan_data = json.loads(task.scan_record) if task.scan_record else {}
-            except:
+            except (ValueError, TypeError):
                 scan_data = {}
             
             # 保存validation结果到scan_record而不是覆盖result